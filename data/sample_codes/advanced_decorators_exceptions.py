@@ -1,22 +1,28 @@
 # Advanced level - decorators, exceptions, file handling
 import functools
-import json
-from typing import List, Dict
+import os
+from typing import Dict, Iterable, Iterator, List
 
-def validate_input(func):
-    """Decorator to validate function inputs"""
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        try:
-            result = func(*args, **kwargs)
-            return result
-        except (ValueError, TypeError) as e:
-            print(f"Input validation error in {func.__name__}: {e}")
-            return None
-        except Exception as e:
-            print(f"Unexpected error in {func.__name__}: {e}")
-            raise
-    return wrapper
+# Only pay for the validation wrapper when VALIDATE is set
+if os.environ.get('VALIDATE'):
+    def validate_input(func):
+        """Decorator to validate function inputs"""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                result = func(*args, **kwargs)
+                return result
+            except (ValueError, TypeError) as e:
+                print(f"Input validation error in {func.__name__}: {e}")
+                return None
+            except Exception as e:
+                print(f"Unexpected error in {func.__name__}: {e}")
+                raise
+        return wrapper
+else:
+    def validate_input(func):
+        """Validation disabled - return the function unwrapped"""
+        return func
 
 class DataProcessor:
     """Advanced data processing with error handling"""
@@ -28,36 +34,58 @@ class DataProcessor:
     @validate_input
     def load_data(self) -> bool:
         """Load data from JSON file with error handling"""
+        import orjson  # Deferred so importing this module stays cheap
+        
         try:
-            with open(self.filename, 'r') as file:
-                self.data = json.load(file)
+            with open(self.filename, 'rb') as file:
+                self.data = orjson.loads(file.read())
             return True
         except FileNotFoundError:
             print(f"File {self.filename} not found")
             return False
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             print(f"Invalid JSON format: {e}")
             return False
     
     @validate_input
     def process_records(self, min_value: float = 0) -> List[Dict]:
-        """Process records with list comprehension and filtering"""
+        """Process records with filtering"""
         if not self.data:
             raise ValueError("No data loaded")
         
-        # Advanced list comprehension with conditional logic
-        processed = [
-            {
+        return list(self._filter_records(self.data, min_value))
+    
+    @staticmethod
+    def _filter_records(records: Iterable[Dict], min_value: float) -> Iterator[Dict]:
+        """Yield the processed form of each record that passes the filter"""
+        for record in records:
+            # Look up each value once per record
+            value = record.get('value')
+            if not (isinstance(value, (int, float)) and value >= min_value):
+                continue
+            yield {
                 'id': record.get('id'),
-                'value': record.get('value', 0) * 1.1,  # Apply 10% increase
+                'value': value * 1.1,  # Apply 10% increase
                 'category': record.get('category', 'unknown').upper(),
                 'processed': True
             }
-            for record in self.data
-            if isinstance(record.get('value'), (int, float)) and record.get('value', 0) >= min_value
-        ]
+    
+    def iter_records(self) -> Iterator[Dict]:
+        """Stream records from the JSON file one at a time"""
+        import ijson
         
-        return processed
+        try:
+            file = open(self.filename, 'rb')
+        except FileNotFoundError:
+            print(f"File {self.filename} not found")
+            return
+        
+        with file:
+            yield from ijson.items(file, 'item', use_float=True)
+    
+    def stream_records(self, min_value: float = 0) -> Iterator[Dict]:
+        """Process records lazily without loading the whole file"""
+        return self._filter_records(self.iter_records(), min_value)
     
     def __enter__(self):
         """Context manager entry"""
@@ -41,6 +41,10 @@ def inefficient_concat(words):
         result = result + word + " "  # Should use join()
     return result
 
+# Corrected: join builds the string in one pass
+def efficient_concat(words):
+    return "".join(word + " " for word in words)
+
 # Error 8: Not understanding truthiness
 def check_empty(value):
     if len(value) == 0:  # Could just use 'if not value:'
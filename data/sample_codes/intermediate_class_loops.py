@@ -2,24 +2,21 @@
 class StudentGradeBook:
     def __init__(self, student_name):
         self.name = student_name
-        self.grades = []
+        self.grades = []  # Update only through add_grade so the cached average stays valid
+        self._average = None  # Cached until the next add_grade
     
     def add_grade(self, grade):
         if grade >= 0 and grade <= 100:
             self.grades.append(grade)
+            self._average = None
         else:
             print("Invalid grade! Must be between 0 and 100.")
     
     def calculate_average(self):
-        if len(self.grades) == 0:
-            return 0
-        
-        total = 0
-        for grade in self.grades:
-            total += grade
-        
-        average = total / len(self.grades)
-        return average
+        if self._average is None:
+            count = len(self.grades)
+            self._average = sum(self.grades) / count if count else 0
+        return self._average
     
     def get_letter_grade(self):
         avg = self.calculate_average()
@@ -36,10 +33,8 @@ class StudentGradeBook:
 
 # Testing the class
 student = StudentGradeBook("John")
-student.add_grade(85)
-student.add_grade(92)
-student.add_grade(78)
-student.add_grade(88)
+for grade in [85, 92, 78, 88]:
+    student.add_grade(grade)
 
 print(f"Student: {student.name}")
 print(f"Average: {student.calculate_average():.1f}")
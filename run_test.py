@@ -6,7 +6,7 @@ Run this from the project root directory
 
 import os
 import sys
-import subprocess
+import unittest
 
 def main():
     """Run tests with proper path setup"""
@@ -26,32 +26,24 @@ def main():
     print("=" * 50)
     
     try:
-        # Try to run tests using python -m unittest
+        # Discover and run tests in this interpreter
         test_dir = os.path.join(project_root, 'test')
-        test_file = os.path.join(test_dir, 'test_analyzer.py')
         
-        if os.path.exists(test_file):
-            print(f"Running tests from: {test_file}")
-            result = subprocess.run([sys.executable, test_file], 
-                                  cwd=project_root,
-                                  capture_output=True, 
-                                  text=True)
+        if os.path.isdir(test_dir):
+            print(f"Running tests from: {test_dir}")
+            loader = unittest.TestLoader()
+            suite = loader.discover(test_dir, pattern='test_*.py')
+            runner = unittest.TextTestRunner(verbosity=2)
+            result = runner.run(suite)
             
-            print("STDOUT:")
-            print(result.stdout)
-            
-            if result.stderr:
-                print("STDERR:")
-                print(result.stderr)
-            
-            if result.returncode == 0:
+            if result.wasSuccessful():
                 print("\n✅ All tests passed!")
-            else:
-                print(f"\n❌ Tests failed with exit code: {result.returncode}")
-                
-            return result.returncode
+                return 0
+            
+            print(f"\n❌ Tests failed: {len(result.failures)} failures, {len(result.errors)} errors")
+            return 1
         else:
-            print(f"❌ Test file not found: {test_file}")
+            print(f"❌ Test directory not found: {test_dir}")
             return 1
             
     except Exception as e:
@@ -4,10 +4,72 @@ Evaluates student programming skills and generates educational feedback
 """
 
 import ast
-import sys
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+# Structural elements counted by parse_code_structure (plus their '_total')
+_STRUCTURE_KEYS = ('functions', 'classes', 'loops', 'conditionals',
+                   'try_blocks', 'comprehensions', 'imports')
+
+# Map AST node types to the structural element they count towards
+_NODE_MAP = {
+    ast.FunctionDef: 'functions', ast.AsyncFunctionDef: 'functions',
+    ast.ClassDef: 'classes',
+    ast.For: 'loops', ast.AsyncFor: 'loops', ast.While: 'loops',
+    ast.If: 'conditionals',
+    ast.Try: 'try_blocks', ast.ExceptHandler: 'try_blocks',
+    ast.ListComp: 'comprehensions', ast.DictComp: 'comprehensions',
+    ast.SetComp: 'comprehensions', ast.GeneratorExp: 'comprehensions',
+    ast.Import: 'imports', ast.ImportFrom: 'imports'
+}
+
+# Skill level indicators
+_SKILL_LEVELS = MappingProxyType({
+    'novice': ('variables', 'print', 'input', 'basic_operators'),
+    'developing': ('functions', 'conditionals', 'loops', 'lists'),
+    'proficient': ('classes', 'exceptions', 'file_ops', 'dictionaries'),
+    'advanced': ('decorators', 'generators', 'context_mgrs', 'metaclasses')
+})
+
+# Map skill levels to concept scores
+_LEVEL_SCORES = (('novice', 0.25), ('developing', 0.5), ('proficient', 0.75), ('advanced', 1.0))
+_LEVEL_SCORE_MAP = MappingProxyType(dict(_LEVEL_SCORES))
+
+# Feedback prompts for each skill level
+_NOVICE_SYNTAX = (
+    "Check your code line by line - which line looks different from Python examples?",
+    "Are all your parentheses, brackets, and colons in the right places?",
+    "Look for syntax errors - missing colons, incorrect indentation, or typos in keywords."
+)
+_NOVICE_OK = (
+    "Try using more descriptive names for your variables.",
+    "Walk through your code with a sample input - does it do what you expect?"
+)
+_DEVELOPING = (
+    "Would breaking this into smaller functions make it easier to understand?",
+    "What happens if someone gives your program unexpected input?",
+    "How would you explain what this code does to another student?"
+)
+_PROFICIENT = (
+    "Are there any programming patterns that could make this code cleaner?",
+    "How would this code perform with much larger inputs?",
+    "What parts of this code might be hard for someone else to modify?"
+)
+_ADVANCED = (
+    "Could you restructure this to follow any well-known design patterns?",
+    "How does your solution handle edge cases and potential failures?",
+    "What would you change if this code needed to handle 1000x more data?"
+)
+
+# Case-folded copies of every prompt, so keyword checks skip per-call .lower()
+_FEEDBACK_LOWERED = MappingProxyType({
+    prompt: prompt.lower()
+    for prompts in (_NOVICE_SYNTAX, _NOVICE_OK, _DEVELOPING, _PROFICIENT, _ADVANCED)
+    for prompt in prompts
+})
+
 @dataclass
 class CodeMetrics:
     """Student code assessment metrics"""
@@ -17,108 +79,84 @@ class CodeMetrics:
     quality_score: float
     total_score: float
 
+@lru_cache(maxsize=256)
+def _parse_and_count(code: str) -> Tuple[Tuple[Tuple[str, int], ...], bool, Optional[str]]:
+    """Parse stripped code once and cache (counts, has_error, error_details)"""
+    try:
+        # Compile straight to an AST without inheriting this module's future flags
+        tree = compile(code, '<unknown>', 'exec', ast.PyCF_ONLY_AST, dont_inherit=True)
+    except SyntaxError as err:
+        return (), True, str(err)
+    
+    # ast.walk is iterative, so deeply nested expressions can't exhaust the stack
+    counts: Dict[str, int] = dict.fromkeys(_STRUCTURE_KEYS, 0)
+    total = 0
+    for node in ast.walk(tree):
+        key = _NODE_MAP.get(type(node))
+        if key:
+            counts[key] += 1
+            total += 1
+    
+    counts['_total'] = total
+    return tuple(counts.items()), False, None
+
 class StudentCodeAnalyzer:
     """Analyzes Python code to assess student programming competence"""
     
-    def __init__(self):
-        # Define skill level indicators
-        self.skill_levels = {
-            'novice': ['variables', 'print', 'input', 'basic_operators'],
-            'developing': ['functions', 'conditionals', 'loops', 'lists'],
-            'proficient': ['classes', 'exceptions', 'file_ops', 'dictionaries'],
-            'advanced': ['decorators', 'generators', 'context_mgrs', 'metaclasses']
-        }
+    # Stateless: all lookup tables are shared module constants
+    __slots__ = ()
+    skill_levels = _SKILL_LEVELS
     
-    def parse_code_structure(self, code: str) -> Dict:
+    def parse_code_structure(self, code: str) -> Dict[str, Any]:
         """Parse code and extract structural elements"""
-        try:
-            tree = ast.parse(code.strip())
-        except SyntaxError as err:
-            return {'has_syntax_error': True, 'error_details': str(err)}
-        
-        # Count different code constructs
-        elements = {
-            'functions': 0, 'classes': 0, 'loops': 0, 'conditionals': 0,
-            'try_blocks': 0, 'comprehensions': 0, 'imports': 0
-        }
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                elements['functions'] += 1
-            elif isinstance(node, ast.ClassDef):
-                elements['classes'] += 1
-            elif isinstance(node, (ast.For, ast.While)):
-                elements['loops'] += 1
-            elif isinstance(node, ast.If):
-                elements['conditionals'] += 1
-            elif isinstance(node, (ast.Try, ast.ExceptHandler)):
-                elements['try_blocks'] += 1
-            elif isinstance(node, (ast.ListComp, ast.DictComp, ast.SetComp, ast.GeneratorExp)):
-                elements['comprehensions'] += 1
-            elif isinstance(node, (ast.Import, ast.ImportFrom)):
-                elements['imports'] += 1
-        
-        return elements
+        # Results are cached, so hand back a fresh dict each call
+        counts, has_error, error_details = _parse_and_count(code.strip())
+        if has_error:
+            return {'has_syntax_error': True, 'error_details': error_details}
+        return dict(counts)
     
-    def determine_skill_level(self, code_elements: Dict) -> str:
+    def determine_skill_level(self, code_elements: Dict[str, Any]) -> str:
         """Assess student skill level based on code complexity"""
         if code_elements.get('has_syntax_error'):
             return 'novice'
         
-        # Calculate complexity indicators
-        advanced_count = code_elements.get('classes', 0) + code_elements.get('try_blocks', 0)
-        intermediate_count = code_elements.get('functions', 0) + code_elements.get('comprehensions', 0)
-        basic_count = code_elements.get('loops', 0) + code_elements.get('conditionals', 0)
-        
-        # Determine level based on feature usage
-        if advanced_count >= 2 or code_elements.get('comprehensions', 0) >= 2:
+        # Advanced: classes/exceptions or heavy comprehension use
+        get = code_elements.get
+        if get('classes', 0) + get('try_blocks', 0) >= 2:
+            return 'advanced'
+        comprehensions = get('comprehensions', 0)
+        if comprehensions >= 2:
             return 'advanced'
-        elif intermediate_count >= 2 or (intermediate_count >= 1 and basic_count >= 3):
+        
+        # Proficient: several functions/comprehensions, or one alongside control flow
+        intermediate_count = get('functions', 0) + comprehensions
+        if intermediate_count >= 2:
+            return 'proficient'
+        basic_count = get('loops', 0) + get('conditionals', 0)
+        if intermediate_count >= 1 and basic_count >= 3:
             return 'proficient'
-        elif basic_count >= 1 or intermediate_count >= 1:
+        
+        if basic_count >= 1 or intermediate_count >= 1:
             return 'developing'
-        else:
-            return 'novice'
+        return 'novice'
     
-    def create_feedback_prompts(self, code: str, skill_level: str, code_elements: Dict) -> List[str]:
+    def create_feedback_prompts(self, code: str, skill_level: str, code_elements: Dict[str, Any]) -> List[str]:
         """Generate educational prompts tailored to student level"""
-        feedback = []
-        
+        prompts: Tuple[str, ...]
         if skill_level == 'novice':
             if code_elements.get('has_syntax_error'):
-                feedback.extend([
-                    "Check your code line by line - which line looks different from Python examples?",
-                    "Are all your parentheses, brackets, and colons in the right places?",
-                    "Look for syntax errors - missing colons, incorrect indentation, or typos in keywords."
-                ])
+                prompts = _NOVICE_SYNTAX
             else:
-                feedback.extend([
-                    "Try using more descriptive names for your variables.",
-                    "Walk through your code with a sample input - does it do what you expect?"
-                ])
-        
+                prompts = _NOVICE_OK
         elif skill_level == 'developing':
-            feedback.extend([
-                "Would breaking this into smaller functions make it easier to understand?",
-                "What happens if someone gives your program unexpected input?",
-                "How would you explain what this code does to another student?"
-            ])
-        
+            prompts = _DEVELOPING
         elif skill_level == 'proficient':
-            feedback.extend([
-                "Are there any programming patterns that could make this code cleaner?",
-                "How would this code perform with much larger inputs?",
-                "What parts of this code might be hard for someone else to modify?"
-            ])
-        
+            prompts = _PROFICIENT
         else:  # advanced
-            feedback.extend([
-                "Could you restructure this to follow any well-known design patterns?",
-                "How does your solution handle edge cases and potential failures?",
-                "What would you change if this code needed to handle 1000x more data?"
-            ])
+            prompts = _ADVANCED
         
-        return feedback
+        # Copy so callers are free to modify their feedback list
+        return list(prompts)
     
     def assess_code(self, code: str) -> Tuple[CodeMetrics, List[str]]:
         """Main method to evaluate student code and generate feedback"""
@@ -132,14 +170,10 @@ class StudentCodeAnalyzer:
             structure_score = 0.0
         else:
             syntax_score = 1.0
-            # Sum only numeric values for structure scoring
-            valid_counts = [v for k, v in code_elements.items() 
-                          if isinstance(v, int) and k != 'has_syntax_error']
-            structure_score = min(1.0, sum(valid_counts) / 8.0)
+            # Total construct count is accumulated while parsing
+            structure_score = min(1.0, code_elements['_total'] / 8.0)
         
-        # Map skill levels to scores
-        level_scores = {'novice': 0.25, 'developing': 0.5, 'proficient': 0.75, 'advanced': 1.0}
-        concept_score = level_scores[skill_level]
+        concept_score = _LEVEL_SCORE_MAP[skill_level]
         quality_score = structure_score * concept_score
         total_score = (syntax_score + structure_score + concept_score + quality_score) / 4
         
@@ -153,21 +187,17 @@ class StudentCodeAnalyzer:
         
         return metrics, feedback
 
-def run_demo():
-    """Test the analyzer with sample student submissions"""
-    analyzer = StudentCodeAnalyzer()
-    
-    # Sample code submissions
-    test_submissions = [
-        # Novice level - missing colon
-        """
+# Sample code submissions used by run_demo
+_TEST_SUBMISSIONS = (
+    # Novice level - missing colon
+    """
 def area_circle(r)
     return 3.14159 * r * r
 print(area_circle(5))
-        """,
-        
-        # Developing level
-        """
+    """,
+    
+    # Developing level
+    """
 class SimpleCalc:
     def __init__(self):
         self.memory = []
@@ -183,10 +213,10 @@ class SimpleCalc:
 my_calc = SimpleCalc()
 answer = my_calc.add_nums(10, 15)
 print(f"Result: {answer}")
-        """,
-        
-        # Advanced level
-        """
+    """,
+    
+    # Advanced level
+    """
 from functools import wraps
 import time
 
@@ -214,14 +244,37 @@ def process_data(data):
     if not data:
         raise ValueError("No data provided")
     return [x**2 for x in data if x > 0]
-        """
-    ]
+    """
+)
+
+def feedback_matches(feedback: List[str], needle: str) -> bool:
+    """Check whether any feedback prompt mentions needle (case-insensitive)"""
+    needle = needle.lower()
+    for prompt in feedback:
+        lowered = _FEEDBACK_LOWERED.get(prompt)
+        if lowered is None:
+            lowered = prompt.lower()
+        if needle in lowered:
+            return True
+    return False
+
+def _assess_one(code: str) -> Tuple[CodeMetrics, List[str]]:
+    """Worker that assesses a single submission in its own process"""
+    return StudentCodeAnalyzer().assess_code(code)
+
+def run_demo() -> None:
+    """Test the analyzer with sample student submissions"""
+    from concurrent.futures import ProcessPoolExecutor
+    
+    # Submissions are independent, so analyse them across processes
+    with ProcessPoolExecutor() as executor:
+        futures = [executor.submit(_assess_one, code) for code in _TEST_SUBMISSIONS]
     
-    for idx, submission in enumerate(test_submissions, 1):
+    for idx, future in enumerate(futures, 1):
         print(f"\n--- Student Submission {idx} Analysis ---")
         
         try:
-            metrics, prompts = analyzer.assess_code(submission)
+            metrics, prompts = future.result()
             
             print("Assessment Results:")
             print(f"  Syntax: {metrics.syntax_score:.2f}")